@@ -0,0 +1,56 @@
+"""
+Gunicorn settings for production serving
+Start with: gunicorn app:app
+The master creates missing tables and the default categories/admin user on
+startup (on_starting below), so a fresh database needs no separate step
+Use `flask --app app run --debug` for local development only
+"""
+
+import multiprocessing
+import os
+from contextlib import ExitStack
+
+bind = os.environ.get('BIND', '0.0.0.0:8000')
+
+# Threads let one worker overlap many MySQL round-trips; each thread holds at
+# most one pooled connection, so threads must stay below pool_size in app.py
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count()))
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 8))
+
+# Import the app once in the master so workers fork with templates and code loaded
+preload_app = True
+timeout = 30
+graceful_timeout = 30
+keepalive = 5
+
+accesslog = '-'
+errorlog = '-'
+
+def on_starting(server):
+    """Create tables and default data once in the master, before any worker forks"""
+    from app import app, db, init_db
+    init_db()
+    # Workers open their own connections; the master keeps none
+    with app.app_context():
+        db.engine.dispose()
+
+def post_fork(server, worker):
+    """Give each worker its own connection pool instead of sockets inherited from the master"""
+    from app import app, db
+    with app.app_context():
+        db.engine.dispose(close=False)
+        
+        # Opt-in: open one pooled connection per thread now, so the first
+        # requests after a (re)start skip the TCP + auth handshake
+        if os.environ.get('WARM_POOL') == '1':
+            try:
+                # Hold all connections open at once so each is a separate one;
+                # leaving the stack returns them to the pool
+                with ExitStack() as stack:
+                    for _ in range(worker.cfg.threads):
+                        stack.enter_context(db.engine.connect())
+            except Exception as e:
+                # An exception here kills the worker; without a warm pool the
+                # first requests just pay the handshake themselves
+                server.log.warning(f"Connection pool warm-up failed: {e}")
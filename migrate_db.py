@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+One-shot schema migration script for existing databases
+Run this once after pulling model changes; db.create_all() only creates
+missing tables, it never alters tables that already exist
+"""
+
+import json
+from datetime import datetime
+from sqlalchemy import inspect, text
+from app import app, db, User, Project, Contribution, Comment
+
+def column_exists(table_name, column_name):
+    """Check whether a column exists on an existing table"""
+    columns = inspect(db.engine).get_columns(table_name)
+    return any(column['name'] == column_name for column in columns)
+
+def migrate_comments():
+    """Move JSON comments from projects.comments into the comments table"""
+    print("🔧 Migrating project comments...")
+
+    if not column_exists('projects', 'comments'):
+        print("✅ projects.comments already removed, nothing to do")
+        return True
+
+    try:
+        usernames = {u.username: u.id for u in db.session.query(User.username, User.id)}
+        rows = db.session.execute(text("SELECT id, comments FROM projects WHERE comments IS NOT NULL AND comments != ''")).fetchall()
+
+        migrated = 0
+        for project_id, raw_comments in rows:
+            try:
+                comments_list = json.loads(raw_comments)
+            except ValueError:
+                comments_list = None
+            if not isinstance(comments_list, list):
+                print(f"⚠️  Project {project_id}: comments are not a JSON list, left in place")
+                continue
+
+            # Entries without a matching user stay in the column instead of being lost
+            leftover = []
+            for entry in comments_list:
+                if not isinstance(entry, dict) or not entry.get('comment'):
+                    continue  # Nothing to keep
+                user_id = usernames.get(entry.get('username'))
+                if user_id is None:
+                    leftover.append(entry)
+                    continue
+
+                created_at = entry.get('created_at')
+                db.session.add(Comment(
+                    text=entry['comment'],
+                    user_id=user_id,
+                    project_id=project_id,
+                    created_at=datetime.fromisoformat(created_at) if created_at else datetime.utcnow()
+                ))
+                migrated += 1
+
+            # Copied entries leave the column in the same commit, so a rerun never copies them twice
+            db.session.execute(
+                text("UPDATE projects SET comments = :comments WHERE id = :id"),
+                {'comments': json.dumps(leftover) if leftover else None, 'id': project_id}
+            )
+            if leftover:
+                print(f"⚠️  Project {project_id}: {len(leftover)} comment(s) without a matching user, left in place")
+
+        db.session.commit()
+        print(f"✅ Migrated {migrated} comment(s)")
+
+        remaining = db.session.execute(text("SELECT COUNT(*) FROM projects WHERE comments IS NOT NULL AND comments != ''")).scalar()
+        if remaining:
+            print(f"❌ {remaining} project(s) still have unmigrated comments; keeping projects.comments")
+            print("   Fix those rows by hand (e.g. create the missing users) and run this script again")
+            return False
+
+        db.session.execute(text("ALTER TABLE projects DROP COLUMN comments"))
+        db.session.commit()
+
+        print("✅ Dropped projects.comments")
+        return True
+
+    except Exception as e:
+        db.session.rollback()
+        print(f"❌ Comment migration failed: {e}")
+        return False
+
+def migrate_project_totals():
+    """Add the denormalized project totals columns and backfill them"""
+    print("\n🔧 Migrating project totals...")
+
+    try:
+        if not column_exists('projects', 'total_raised'):
+            db.session.execute(text("ALTER TABLE projects ADD COLUMN total_raised DECIMAL(10, 2) NOT NULL DEFAULT 0"))
+            print("   ➕ Added projects.total_raised")
+        if not column_exists('projects', 'contribution_count'):
+            db.session.execute(text("ALTER TABLE projects ADD COLUMN contribution_count INTEGER NOT NULL DEFAULT 0"))
+            print("   ➕ Added projects.contribution_count")
+
+        # Recompute from scratch so the backfill also repairs any drift
+        db.session.execute(
+            db.update(Project).values(
+                total_raised=db.select(db.func.coalesce(db.func.sum(Contribution.amount), 0))
+                    .where(Contribution.project_id == Project.id).scalar_subquery(),
+                contribution_count=db.select(db.func.count(Contribution.id))
+                    .where(Contribution.project_id == Project.id).scalar_subquery()
+            )
+        )
+        db.session.commit()
+
+        print("✅ Project totals backfilled")
+        return True
+
+    except Exception as e:
+        db.session.rollback()
+        print(f"❌ Project totals migration failed: {e}")
+        return False
+
+# Indexes superseded by a composite index with the same leading column
+OBSOLETE_INDEXES = {
+    'projects': ['ix_projects_user_id'],  # replaced by ix_projects_user_created
+}
+
+def migrate_indexes():
+    """Create any model-declared indexes missing from existing tables"""
+    print("\n🔧 Checking indexes...")
+
+    try:
+        inspector = inspect(db.engine)
+        existing_tables = set(inspector.get_table_names())
+        created = 0
+        for table in db.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            existing_indexes = {index['name'] for index in inspector.get_indexes(table.name)}
+            for index in table.indexes:
+                if index.name not in existing_indexes:
+                    index.create(db.engine)
+                    print(f"   ➕ Created index {index.name} on {table.name}")
+                    created += 1
+
+            # Drop superseded indexes only once their replacement exists
+            for index_name in OBSOLETE_INDEXES.get(table.name, []):
+                if index_name in existing_indexes:
+                    db.session.execute(text(f"DROP INDEX {index_name} ON {table.name}"))
+                    db.session.commit()
+                    print(f"   ➖ Dropped index {index_name} on {table.name}")
+
+        print(f"✅ Indexes up to date ({created} created)")
+        return True
+
+    except Exception as e:
+        print(f"❌ Index migration failed: {e}")
+        return False
+
+def main():
+    print("🚀 Starting database migration...\n")
+
+    with app.app_context():
+        # New tables (e.g. comments) must exist before data is copied into them
+        db.create_all()
+        comments_migrated = migrate_comments()
+        totals_migrated = migrate_project_totals()
+        indexes_migrated = migrate_indexes()
+
+    print("\n" + "="*50)
+    print("📊 MIGRATION SUMMARY:")
+    print(f"   Comments: {'✅ PASS' if comments_migrated else '❌ FAIL'}")
+    print(f"   Totals:   {'✅ PASS' if totals_migrated else '❌ FAIL'}")
+    print(f"   Indexes:  {'✅ PASS' if indexes_migrated else '❌ FAIL'}")
+
+if __name__ == "__main__":
+    main()